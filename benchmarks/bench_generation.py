@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Benchmark project generation: Jinja rendering and post-generation hook cost.
+
+Renders every project type repeatedly and times, per run:
+
+- ``cookiecutter``: a full ``cookiecutter()`` call, as ``generate.py`` and the tests do
+- ``render``: ``generate_files()`` with hooks disabled, i.e. Jinja rendering and file I/O
+- ``hook``: ``hooks/post_gen_project.py`` run on the rendered project
+- ``batch``: ``generate.BatchRenderer.render()``, which reuses the parsed template
+
+With ``--scale`` the template is copied and padded with extra copies of its files
+to show how generation cost grows with template size. Everything runs offline.
+
+Usage:
+    python benchmarks/bench_generation.py --repeat 10 --output results.json
+    python benchmarks/bench_generation.py --compare results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(REPO_ROOT))
+
+from generate import BatchRenderer  # noqa: E402
+
+PROJECT_TYPES = ["library", "fastapi", "streamlit", "datascience"]
+PHASES = ["cookiecutter", "render", "hook", "batch"]
+
+
+def project_context(project_type: str) -> dict[str, str]:
+    """Context used for every benchmarked project (mirrors tests/conftest.py)."""
+    return {
+        "project_name": "Bench Project",
+        "project_slug": f"bench-{project_type}",
+        "project_type": project_type,
+        "use_docker": "yes",
+        "use_ci": "yes",
+        "git_provider": "gitlab",
+        "gitlab_url": "https://gitlab.com",
+        "gitlab_group": "bench-group",
+    }
+
+
+def padded_template(scale: int, workdir: Path) -> Path:
+    """Copy the template and add ``scale - 1`` extra copies of the project template files."""
+    if scale == 1:
+        return REPO_ROOT
+    template_dir = workdir / f"template-x{scale}"
+
+    def ignore(directory: str, names: list[str]) -> set[str]:
+        # The repository's own tooling, not the project template's benchmarks/ and tests/
+        skipped = {"__pycache__"}
+        if Path(directory) == REPO_ROOT:
+            skipped |= {".git", ".venv", "benchmarks", "tests"}
+        return skipped & set(names)
+
+    shutil.copytree(REPO_ROOT, template_dir, ignore=ignore)
+    project_template = next(template_dir.glob("{{cookiecutter.*}}"))
+    sources = [p for p in project_template.rglob("*") if p.is_file()]
+    for copy in range(1, scale):
+        for source in sources:
+            target = project_template / f"padding_{copy}" / source.relative_to(project_template)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+    return template_dir
+
+
+def template_size(template_dir: Path) -> dict[str, int]:
+    """Number of files and bytes in the project template."""
+    project_template = next(template_dir.glob("{{cookiecutter.*}}"))
+    files = [p for p in project_template.rglob("*") if p.is_file()]
+    return {"files": len(files), "bytes": sum(p.stat().st_size for p in files)}
+
+
+@contextmanager
+def quiet_stdout():
+    """Silence stdout at the file descriptor level, including the hook subprocess."""
+    sys.stdout.flush()
+    saved = os.dup(1)
+    with open(os.devnull, "w") as devnull:
+        os.dup2(devnull.fileno(), 1)
+        try:
+            yield
+        finally:
+            sys.stdout.flush()
+            os.dup2(saved, 1)
+            os.close(saved)
+
+
+def time_once(template_dir: Path, project_type: str, workdir: Path, renderer: BatchRenderer) -> dict[str, float]:
+    """Time each generation phase once for one project type."""
+    from cookiecutter.generate import generate_context, generate_files
+    from cookiecutter.hooks import run_hook_from_repo_dir
+    from cookiecutter.main import cookiecutter
+    from cookiecutter.prompt import prompt_for_config
+
+    context = project_context(project_type)
+    timings = {}
+
+    output = Path(tempfile.mkdtemp(dir=workdir))
+    start = time.perf_counter()
+    cookiecutter(str(template_dir), no_input=True, extra_context=context, output_dir=str(output))
+    timings["cookiecutter"] = time.perf_counter() - start
+
+    output = Path(tempfile.mkdtemp(dir=workdir))
+    full_context = generate_context(
+        context_file=str(template_dir / "cookiecutter.json"), extra_context=context
+    )
+    full_context["cookiecutter"] = prompt_for_config(full_context, no_input=True)
+    start = time.perf_counter()
+    project_dir = generate_files(
+        repo_dir=str(template_dir), context=full_context, output_dir=str(output), accept_hooks=False
+    )
+    timings["render"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    run_hook_from_repo_dir(str(template_dir), "post_gen_project", project_dir, full_context, False)
+    timings["hook"] = time.perf_counter() - start
+
+    output = Path(tempfile.mkdtemp(dir=workdir))
+    start = time.perf_counter()
+    renderer.render(context, output)
+    timings["batch"] = time.perf_counter() - start
+    return timings
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Summary statistics of a list of timings, in milliseconds."""
+    return {
+        "min_ms": min(samples) * 1000,
+        "median_ms": statistics.median(samples) * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def run_benchmarks(repeat: int, scales: list[int], project_types: list[str]) -> dict:
+    """Run every benchmark and return the results document."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench-generation-") as tmp:
+        workdir = Path(tmp)
+        for scale in scales:
+            template_dir = padded_template(scale, workdir)
+            renderer = BatchRenderer(template_dir)
+            size = template_size(template_dir)
+            for project_type in project_types:
+                samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+                with quiet_stdout():
+                    # One warm-up run so imports and filesystem caches do not skew the first sample
+                    time_once(template_dir, project_type, workdir, renderer)
+                    for _ in range(repeat):
+                        for phase, seconds in time_once(template_dir, project_type, workdir, renderer).items():
+                            samples[phase].append(seconds)
+                results.append(
+                    {
+                        "project_type": project_type,
+                        "scale": scale,
+                        "template_files": size["files"],
+                        "template_bytes": size["bytes"],
+                        "phases": {phase: summarize(samples[phase]) for phase in PHASES},
+                    }
+                )
+                print_result(results[-1])
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def git_commit() -> str:
+    """Current commit of the template repository, if available."""
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=False
+    )
+    return result.stdout.strip() if result.returncode == 0 else "unknown"
+
+
+def print_result(result: dict) -> None:
+    """Print the median time of each phase for one benchmark."""
+    phases = "  ".join(f"{phase} {stats['median_ms']:7.1f} ms" for phase, stats in result["phases"].items())
+    print(f"{result['project_type']:<12} x{result['scale']:<3} ({result['template_files']:4d} files)  {phases}")
+
+
+def compare(baseline: dict, current: dict) -> None:
+    """Print the change in median time of each phase against a baseline run."""
+    print(f"\nComparison with {baseline['commit']} ({baseline['timestamp']}):")
+    previous = {(r["project_type"], r["scale"]): r for r in baseline["results"]}
+    for result in current["results"]:
+        old = previous.get((result["project_type"], result["scale"]))
+        if old is None:
+            continue
+        changes = []
+        for phase, stats in result["phases"].items():
+            if phase in old["phases"]:
+                before = old["phases"][phase]["median_ms"]
+                changes.append(f"{phase} {(stats['median_ms'] - before) / before * 100:+6.1f}%")
+        print(f"{result['project_type']:<12} x{result['scale']:<3} " + "  ".join(changes))
+
+
+def main() -> None:
+    """Run the generation benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark template rendering and hook cost")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per project type")
+    parser.add_argument("--scale", default="1", help="comma-separated template size multipliers, e.g. 1,2,4")
+    parser.add_argument("--project-type", action="append", choices=PROJECT_TYPES, help="limit to project types")
+    parser.add_argument("--output", type=Path, help="write results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="JSON results of a previous run to compare against")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scale.split(",")]
+    results = run_benchmarks(args.repeat, scales, args.project_type or PROJECT_TYPES)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        compare(json.loads(args.compare.read_text()), results)
+
+
+if __name__ == "__main__":
+    main()
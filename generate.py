@@ -1,11 +1,22 @@
 #!/usr/bin/env python3
 """Custom generator script that handles conditional prompts for cookiecutter."""
 
+import argparse
+import io
 import json
 import os
+import shutil
 import subprocess
 import sys
+import time
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any
+
+TEMPLATE_DIR = Path(__file__).parent
 
 
 def prompt_user(prompt_text: str, default: str = "") -> str:
@@ -23,8 +34,8 @@ def prompt_user(prompt_text: str, default: str = "") -> str:
         sys.exit(1)
 
 
-def main() -> None:
-    """Main generation function with conditional prompts."""
+def run_interactive() -> None:
+    """Generate a single project with conditional prompts."""
     print("Python SOTA Starter Pack - Project Generator\n")
     
     # Basic project info
@@ -92,7 +103,7 @@ def main() -> None:
     }
     
     # Write context to a temporary JSON file
-    template_dir = Path(__file__).parent
+    template_dir = TEMPLATE_DIR
     context_file = template_dir / ".cookiecutter_context.json"
     with open(context_file, "w") as f:
         json.dump(context, f)
@@ -127,5 +138,246 @@ def main() -> None:
             context_file.unlink()
 
 
+@dataclass
+class RenderResult:
+    """Outcome of rendering one project in batch mode."""
+
+    project_slug: str
+    project_type: str
+    path: str
+    seconds: float
+
+
+@dataclass
+class _TemplateFile:
+    """A template file whose name and contents are compiled once per batch."""
+
+    source: Path
+    name: Any
+    binary: bool
+    newline: str | None
+
+
+class BatchRenderer:
+    """Render many projects from a single parsed copy of the template.
+
+    ``cookiecutter()`` rebuilds its Jinja environment, walks the template tree
+    and recompiles every file on each call. The renderer does that work once:
+    file and directory names are compiled up front, file contents are compiled
+    on first use and cached by the shared environment, and the post-generation
+    hook is executed in-process instead of in a fresh interpreter.
+    """
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR) -> None:
+        from binaryornot.check import is_binary
+        from cookiecutter.find import find_template
+        from cookiecutter.generate import generate_context
+        from cookiecutter.utils import create_env_with_context
+        from jinja2 import FileSystemLoader
+
+        self.template_dir = template_dir
+        self.context_file = template_dir / "cookiecutter.json"
+        # Jinja extensions listed in cookiecutter.json are imported from the template root
+        if str(template_dir) not in sys.path:
+            sys.path.append(str(template_dir))
+        self.env = create_env_with_context(generate_context(context_file=str(self.context_file)))
+        self.env.auto_reload = False
+        self.project_template = project_template = Path(find_template(template_dir, self.env))
+        self.env.loader = FileSystemLoader(str(project_template))
+        self.root_name = self.env.from_string(project_template.name)
+
+        self.dirs = []
+        self.files = []
+        for root, dirs, files in os.walk(project_template):
+            dirs.sort()
+            rel_root = Path(root).relative_to(project_template)
+            for d in dirs:
+                self.dirs.append(self.env.from_string((rel_root / d).as_posix()))
+            for f in sorted(files):
+                source = Path(root) / f
+                binary = is_binary(str(source))
+                newline = None
+                if not binary:
+                    with open(source, encoding="utf-8") as rd:
+                        rd.readline()
+                    newline = rd.newlines[0] if isinstance(rd.newlines, tuple) else rd.newlines
+                self.files.append(
+                    _TemplateFile(
+                        source=source,
+                        name=self.env.from_string((rel_root / f).as_posix()),
+                        binary=binary,
+                        newline=newline,
+                    )
+                )
+
+        hook_path = template_dir / "hooks" / "post_gen_project.py"
+        self.hook_path = hook_path if hook_path.exists() else None
+        self.hook = self.env.from_string(hook_path.read_text()) if self.hook_path else None
+
+    def build_context(self, overrides: dict[str, Any]) -> dict[str, Any]:
+        """Build the full cookiecutter context for one manifest entry."""
+        from cookiecutter.generate import generate_context
+        from cookiecutter.prompt import prompt_for_config
+
+        context = generate_context(
+            context_file=str(self.context_file),
+            extra_context={k: context_value(v) for k, v in overrides.items()},
+        )
+        context["cookiecutter"] = prompt_for_config(context, no_input=True)
+        return context
+
+    def render(self, overrides: dict[str, Any], output_dir: Path, quiet: bool = True) -> RenderResult:
+        """Render one project into ``output_dir`` and run its post-generation hook."""
+        from cookiecutter.exceptions import OutputDirExistsException
+        from cookiecutter.utils import work_in
+
+        start = time.perf_counter()
+        context = self.build_context(overrides)
+        project_dir = output_dir / self.root_name.render(**context)
+        if project_dir.exists():
+            raise OutputDirExistsException(f'Error: "{project_dir}" directory already exists')
+        project_dir.mkdir(parents=True)
+
+        for name in self.dirs:
+            (project_dir / name.render(**context)).mkdir(parents=True, exist_ok=True)
+
+        newline_override = context["cookiecutter"].get("_new_lines")
+        for template_file in self.files:
+            outfile = project_dir / template_file.name.render(**context)
+            # An empty rendered file name means the file is not wanted for this context
+            if outfile.is_dir():
+                continue
+            if template_file.binary:
+                shutil.copyfile(template_file.source, outfile)
+            else:
+                name = template_file.source.relative_to(self.project_template).as_posix()
+                rendered = self.env.get_template(name).render(**context)
+                with open(
+                    outfile, "w", encoding="utf-8", newline=newline_override or template_file.newline
+                ) as fh:
+                    fh.write(rendered)
+            shutil.copymode(template_file.source, outfile)
+
+        if self.hook is not None:
+            code = compile(self.hook.render(**context), str(self.hook_path), "exec")
+            stdout = io.StringIO() if quiet else sys.stdout
+            with work_in(project_dir), redirect_stdout(stdout):
+                exec(code, {"__name__": "__main__"})
+
+        return RenderResult(
+            project_slug=context["cookiecutter"]["project_slug"],
+            project_type=context["cookiecutter"]["project_type"],
+            path=str(project_dir),
+            seconds=time.perf_counter() - start,
+        )
+
+
+def context_value(value: Any) -> str:
+    """Manifest value as cookiecutter would prompt for it: booleans become ``yes``/``no``."""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    return str(value)
+
+
+_worker_renderer: BatchRenderer | None = None
+
+
+def _init_worker(template_dir: Path) -> None:
+    """Parse the template once per pool worker."""
+    global _worker_renderer
+    _worker_renderer = BatchRenderer(template_dir)
+
+
+def _render_in_worker(overrides: dict[str, Any], output_dir: Path) -> RenderResult:
+    """Render one project with the worker's renderer."""
+    assert _worker_renderer is not None
+    return _worker_renderer.render(overrides, output_dir)
+
+
+def load_manifest(path: Path) -> list[dict[str, Any]]:
+    """Load project contexts from a JSON or TOML manifest.
+
+    JSON manifests are either a list of contexts or an object with a
+    ``projects`` list; TOML manifests use ``[[projects]]`` tables.
+    """
+    if path.suffix == ".toml":
+        data = tomllib.loads(path.read_text())
+    else:
+        data = json.loads(path.read_text())
+    projects = data["projects"] if isinstance(data, dict) else data
+    if not isinstance(projects, list) or not all(isinstance(p, dict) for p in projects):
+        raise ValueError(f"{path}: manifest must contain a list of project contexts")
+    return projects
+
+
+def render_batch(
+    projects: list[dict[str, Any]],
+    output_dir: Path,
+    jobs: int = 1,
+    template_dir: Path = TEMPLATE_DIR,
+) -> list[RenderResult]:
+    """Render every project context, optionally across a process pool."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = output_dir.absolute()
+    if jobs <= 1:
+        renderer = BatchRenderer(template_dir)
+        return [renderer.render(overrides, output_dir) for overrides in projects]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(template_dir,)
+    ) as pool:
+        futures = [pool.submit(_render_in_worker, overrides, output_dir) for overrides in projects]
+        return [future.result() for future in futures]
+
+
+def run_batch(manifest: Path, output_dir: Path, jobs: int, report: Path | None) -> None:
+    """Render all projects listed in a manifest and report per-project wall time."""
+    try:
+        projects = load_manifest(manifest)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error reading manifest: {e}")
+        sys.exit(1)
+
+    print(f"Rendering {len(projects)} project(s) from {manifest} with {jobs} job(s)\n")
+    start = time.perf_counter()
+    try:
+        results = render_batch(projects, output_dir, jobs)
+    except ImportError:
+        print("Error: cookiecutter not installed. Install it with: pip install cookiecutter")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error generating project: {e}")
+        sys.exit(1)
+    total = time.perf_counter() - start
+
+    for result in results:
+        print(f"  {result.project_slug:<30} {result.project_type:<12} {result.seconds * 1000:8.1f} ms")
+    print(f"\n✅ Generated {len(results)} project(s) in {total:.2f}s ({len(results) / total:.1f} projects/s)")
+
+    if report is not None:
+        report.write_text(
+            json.dumps(
+                {"jobs": jobs, "total_seconds": total, "projects": [asdict(r) for r in results]},
+                indent=2,
+            )
+        )
+        print(f"Timing report written to {report}")
+
+
+def main() -> None:
+    """Generate one project interactively, or many from a manifest with --batch."""
+    parser = argparse.ArgumentParser(description="Python SOTA Starter Pack - Project Generator")
+    parser.add_argument("--batch", type=Path, metavar="MANIFEST", help="JSON/TOML list of project contexts")
+    parser.add_argument("--output-dir", type=Path, default=Path("."), help="where batch projects are written")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes for batch rendering")
+    parser.add_argument("--report", type=Path, help="write batch timings as JSON to this file")
+    args = parser.parse_args()
+
+    if args.batch is None:
+        run_interactive()
+    else:
+        run_batch(args.batch, args.output_dir, args.jobs, args.report)
+
+
 if __name__ == "__main__":
     main()
@@ -1,18 +1,79 @@
 """Post-generation hook to clean up project files based on project type."""
 
 import os
-import shutil
 from pathlib import Path
 
+import yaml
 
-def remove_file(filepath: str) -> None:
-    """Remove a file if it exists."""
-    path = Path(filepath)
-    if path.exists():
-        if path.is_file():
-            path.unlink()
-        elif path.is_dir():
-            shutil.rmtree(path)
+# CI jobs that are only kept when their feature is enabled; other jobs always run.
+# Jobs are only ever dropped: a job that applies to every configuration, like
+# SonarQube in the GitLab pipeline, is simply written in the CI file.
+CI_JOB_FEATURES = {
+    "build-package": "pypi",
+    "publish-pypi": "pypi",
+    "build-docker": "docker",
+    "build-docs": "docs",
+    "pages": "docs",
+}
+
+# GitLab runs jobs without an explicit stage in the "test" stage
+DEFAULT_CI_STAGE = "test"
+
+
+def remove_empty_dirs(root: Path) -> None:
+    """Remove directories left empty because none of their files apply to this project.
+
+    Optional files are skipped at render time (see ``local_extensions.py``), but
+    cookiecutter still creates every template directory.
+    """
+    for dirpath, _, _ in sorted(os.walk(root), key=lambda entry: entry[0], reverse=True):
+        path = Path(dirpath)
+        if path != root and not any(path.iterdir()):
+            path.rmdir()
+
+
+def node_lines(lines: list[str], key: yaml.Node, value: yaml.Node) -> range:
+    """Line numbers spanned by a mapping entry, including the blank lines that follow it."""
+    end = value.end_mark
+    # Block nodes end where the next entry starts; other nodes end inside their last line
+    if end.line < len(lines) and lines[end.line][: end.column].strip():
+        return range(key.start_mark.line, end.line + 1)
+    return range(key.start_mark.line, end.line)
+
+
+def prune_ci_jobs(ci_file: Path, features: dict[str, bool]) -> None:
+    """Drop the jobs of disabled features, and stages left without jobs, from a CI file.
+
+    The file is parsed once to locate each job; the lines of dropped jobs are then
+    removed in a single pass, so comments and formatting of the kept jobs are
+    preserved. Works for GitLab CI (jobs at the top level) and GitHub Actions
+    (jobs under ``jobs:``).
+    """
+    with open(ci_file, encoding="utf-8", newline="") as f:
+        lines = f.readlines()
+    root = yaml.compose("".join(lines))
+    if not isinstance(root, yaml.MappingNode):
+        return
+
+    top_level = {key.value: value for key, value in root.value}
+    jobs = top_level.get("jobs", root)
+    dropped: set[int] = set()
+    used_stages = set()
+    for key, value in jobs.value:
+        feature = CI_JOB_FEATURES.get(key.value)
+        if feature is not None and not features[feature]:
+            dropped.update(node_lines(lines, key, value))
+        elif isinstance(value, yaml.MappingNode):
+            job = {k.value: v for k, v in value.value}
+            used_stages.add(job["stage"].value if "stage" in job else DEFAULT_CI_STAGE)
+
+    stages = top_level.get("stages")
+    if jobs is root and isinstance(stages, yaml.SequenceNode):
+        dropped.update(stage.start_mark.line for stage in stages.value if stage.value not in used_stages)
+
+    if dropped:
+        with open(ci_file, "w", encoding="utf-8", newline="") as f:
+            f.writelines(line for number, line in enumerate(lines) if number not in dropped)
 
 
 def main() -> None:
@@ -38,69 +99,18 @@ def main() -> None:
         print(f"⚠️  Warning: Unknown project type '{project_type}'. Valid types: {valid_types}")
         print(f"   Proceeding with '{project_type}' but some features may not work correctly.")
 
-    # Remove test files not relevant to project type
-    if project_type == "fastapi":
-        remove_file("tests/test_streamlit.py")
-        remove_file("tests/test_main.py")
-    elif project_type == "streamlit":
-        remove_file("tests/test_api.py")
-        remove_file("tests/test_main.py")
-    elif project_type == "datascience":
-        remove_file("tests/test_api.py")
-        remove_file("tests/test_streamlit.py")
-        # Keep test_main.py for datascience
-    else:  # library
-        remove_file("tests/test_api.py")
-        remove_file("tests/test_streamlit.py")
-
-    # Remove mkdocs for datascience (not typically used)
-    if project_type == "datascience":
-        remove_file("mkdocs.yml")
-        remove_file("docs")
-
-    # Remove notebooks for non-datascience projects
-    if project_type != "datascience":
-        remove_file("notebooks")
-
-    # Remove Dockerfile if not using Docker
-    if "{{ cookiecutter.use_docker }}" != "yes":
-        remove_file("Dockerfile")
-        remove_file(".dockerignore")
-
-    # Remove CI/CD files based on configuration
-    use_ci = "{{ cookiecutter.use_ci }}"
-    git_provider = "{{ cookiecutter.git_provider }}"
-    
-    if use_ci != "yes":
-        remove_file(".gitlab-ci.yml")
-        remove_file(".github")
-        remove_file("sonar-project.properties")
-    else:
-        # Remove GitLab CI if using GitHub
-        if git_provider == "github":
-            remove_file(".gitlab-ci.yml")
-            remove_file("sonar-project.properties")
-        # Remove GitHub workflows if using GitLab
-        elif git_provider == "gitlab":
-            remove_file(".github")
-
-    # Update .gitlab-ci.yml to remove PyPI publishing if not needed
-    if "{{ cookiecutter.publish_to_pypi }}" != "yes" and use_ci == "yes" and git_provider == "gitlab":
-        ci_file = project_root / ".gitlab-ci.yml"
+    # Files for other project types, Docker and CI providers were never rendered
+    remove_empty_dirs(project_root)
+
+    # Keep only the CI jobs of enabled features
+    features = {
+        "pypi": "{{ cookiecutter.publish_to_pypi }}" == "yes",
+        "docker": "{{ cookiecutter.use_docker }}" == "yes",
+        "docs": project_type != "datascience",
+    }
+    for ci_file in [project_root / ".gitlab-ci.yml", project_root / ".github" / "workflows" / "ci.yml"]:
         if ci_file.exists():
-            content = ci_file.read_text()
-            # Remove PyPI publishing sections
-            lines = content.split("\n")
-            new_lines = []
-            skip_section = False
-            for line in lines:
-                if "build-package:" in line or "publish-pypi:" in line:
-                    skip_section = True
-                if skip_section and line and not line.startswith(" ") and not line.startswith("\t"):
-                    skip_section = False
-                if not skip_section:
-                    new_lines.append(line)
-            ci_file.write_text("\n".join(new_lines))
+            prune_ci_jobs(ci_file, features)
 
     print(f"✅ Project generated successfully as {project_type} type!")
     print("\nNext steps:")
@@ -0,0 +1,45 @@
+"""Jinja extensions for the project template.
+
+``cookiecutter.json`` loads :class:`ManifestExtension`, which decides which files
+are generated for a given configuration. Files that only belong to some
+configurations are named ``{{ when('feature', 'name.ext') }}``: for other
+configurations the name renders empty, and cookiecutter skips the file without
+rendering its contents.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from jinja2 import Environment, pass_context
+from jinja2.ext import Extension
+from jinja2.runtime import Context
+
+# Manifest of optional features: which configurations each one is generated for.
+# Files not guarded by ``when()`` are generated for every configuration.
+FEATURES: dict[str, Callable[[dict[str, Any]], bool]] = {
+    "library": lambda c: c["project_type"] == "library",
+    "fastapi": lambda c: c["project_type"] == "fastapi",
+    "streamlit": lambda c: c["project_type"] == "streamlit",
+    "datascience": lambda c: c["project_type"] == "datascience",
+    # Library and datascience projects ship a main() function with its own tests
+    "cli": lambda c: c["project_type"] in ("library", "datascience"),
+    "docs": lambda c: c["project_type"] != "datascience",
+    "notebooks": lambda c: c["project_type"] == "datascience",
+    "docker": lambda c: c["use_docker"] == "yes",
+    "gitlab_ci": lambda c: c["use_ci"] == "yes" and c["git_provider"] == "gitlab",
+    "github_ci": lambda c: c["use_ci"] == "yes" and c["git_provider"] == "github",
+}
+
+
+@pass_context
+def when(context: Context, feature: str, name: str) -> str:
+    """Return ``name`` if ``feature`` is enabled for this configuration, else ``""``."""
+    return name if FEATURES[feature](context["cookiecutter"]) else ""
+
+
+class ManifestExtension(Extension):
+    """Expose ``when()`` to templates and file names."""
+
+    def __init__(self, environment: Environment) -> None:
+        super().__init__(environment)
+        environment.globals["when"] = when
@@ -15,9 +15,9 @@ def main():
     print(f"Tests directory: {tests_dir}")
     print()
     
-    # Run pytest
+    # Run pytest in parallel, keeping tests that share a generated project on one worker
     result = subprocess.run(
-        ["uv", "run", "pytest", str(tests_dir), "-v", "--tb=short"],
+        ["uv", "run", "pytest", str(tests_dir), "-v", "--tb=short", "-n", "auto", "--dist", "loadgroup"],
         cwd=project_root,
     )
     
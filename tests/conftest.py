@@ -1,14 +1,54 @@
 """Shared fixtures and utilities for end-to-end tests."""
 
+import json
+import os
+import re
 import shutil
 import subprocess
 import tempfile
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 import pytest
 
+PROJECT_TYPES = ["library", "fastapi", "streamlit", "datascience"]
 
-@pytest.fixture
+# Upper bounds for the Docker image checks, overridable with the environment variables
+# DOCKER_IMAGE_MAX_MB, DOCKER_BUILD_MAX_SECONDS, DOCKER_REBUILD_MAX_SECONDS and
+# DOCKER_COLD_START_MAX_SECONDS. Image sizes are per project type or build target.
+DOCKER_IMAGE_MAX_MB = {
+    "library": 250,
+    "fastapi": 400,
+    "streamlit": 700,
+    "datascience": 1600,
+    "datascience-batch": 900,
+}
+DOCKER_BUILD_MAX_SECONDS = 600.0
+DOCKER_REBUILD_MAX_SECONDS = 60.0
+DOCKER_COLD_START_MAX_SECONDS = 20.0
+
+
+@dataclass
+class CommandStats:
+    """Wall time, CPU time and peak memory of one command run by run_command."""
+
+    step: str
+    command: str
+    project_type: str
+    returncode: int
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_mb: float
+
+
+# Commands run by this process, and the project type of each generated project directory
+COMMAND_STATS: list[CommandStats] = []
+PROJECT_TYPE_BY_PATH: dict[Path, str] = {}
+
+
+@pytest.fixture(scope="session")
 def template_dir():
     """Get the template directory."""
     return Path(__file__).parent.parent.absolute()
@@ -24,15 +64,52 @@ def temp_dir():
         shutil.rmtree(temp_path, ignore_errors=True)
 
 
+def command_step(cmd: list[str]) -> str:
+    """Short name used to aggregate commands, e.g. ``uv sync`` or ``uv run pytest``."""
+    if cmd[:2] == ["uv", "run"]:
+        return " ".join(cmd[:3])
+    return " ".join(cmd[:2])
+
+
 def run_command(cmd: list[str], cwd: Path, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a command and return the result."""
-    result = subprocess.run(
-        cmd,
-        cwd=cwd,
-        capture_output=True,
-        text=True,
-        check=check,
+    """Run a command, record its resource usage and return the result."""
+    with tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
+        start = time.perf_counter()
+        process = subprocess.Popen(cmd, cwd=cwd, stdout=stdout_file, stderr=stderr_file)
+        try:
+            # wait4 reaps the child and returns its rusage, which includes the descendants
+            # it waited for (e.g. the interpreter started by ``uv run``)
+            _, status, usage = os.wait4(process.pid, 0)
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        wall_seconds = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        stdout_file.seek(0)
+        stderr_file.seek(0)
+        result = subprocess.CompletedProcess(
+            cmd,
+            process.returncode,
+            stdout_file.read().decode(errors="replace"),
+            stderr_file.read().decode(errors="replace"),
+        )
+
+    COMMAND_STATS.append(
+        CommandStats(
+            step=command_step(cmd),
+            command=" ".join(cmd),
+            project_type=PROJECT_TYPE_BY_PATH.get(Path(cwd).resolve(), "other"),
+            returncode=result.returncode,
+            wall_seconds=wall_seconds,
+            cpu_seconds=usage.ru_utime + usage.ru_stime,
+            # ru_maxrss is reported in kilobytes on Linux; the kernel carries the RSS of the
+            # forked test process across exec, so it is a floor for small commands
+            peak_rss_mb=usage.ru_maxrss / 1024,
+        )
     )
+    if check:
+        result.check_returncode()
     # Include both stdout and stderr in error messages for better debugging
     if result.returncode != 0:
         error_msg = f"Command failed: {' '.join(cmd)}\n"
@@ -82,6 +159,7 @@ def generate_project(
 
     project_path = output_dir / project_slug
     assert project_path.exists(), f"Project directory {project_path} was not created"
+    PROJECT_TYPE_BY_PATH[project_path.resolve()] = project_type
     
     # Verify essential files exist
     assert (project_path / "pyproject.toml").exists(), f"pyproject.toml not found in {project_path}"
@@ -118,6 +196,67 @@ def setup_git_repo(project_path: Path) -> None:
         )
 
 
+def docker_build(
+    project_path: Path, image_name: str, target: str | None = None
+) -> tuple[subprocess.CompletedProcess, float]:
+    """Build the project's image with plain BuildKit output; return the result and wall time."""
+    target_args = ["--target", target] if target else []
+    start = time.perf_counter()
+    result = run_command(
+        ["docker", "build", "--progress=plain", *target_args, "-t", image_name, "."],
+        cwd=project_path,
+        check=False,
+    )
+    return result, time.perf_counter() - start
+
+
+def check_docker_image(
+    project_path: Path,
+    project_type: str,
+    image_name: str,
+    build_seconds: float,
+    target: str | None = None,
+) -> None:
+    """Check build time, image size and runtime contents, and that code changes reuse cached dependencies."""
+    build_budget = float(os.environ.get("DOCKER_BUILD_MAX_SECONDS", DOCKER_BUILD_MAX_SECONDS))
+    assert build_seconds <= build_budget, f"Docker build took {build_seconds:.0f}s (budget {build_budget:.0f}s)"
+
+    result = run_command(
+        ["docker", "image", "inspect", "--format", "{{.Size}}", image_name], cwd=project_path
+    )
+    size_mb = int(result.stdout.strip()) / 1024**2
+    size_key = f"{project_type}-{target}" if target else project_type
+    size_budget = float(os.environ.get("DOCKER_IMAGE_MAX_MB", DOCKER_IMAGE_MAX_MB[size_key]))
+    assert size_mb <= size_budget, f"Docker image is {size_mb:.0f} MB (budget {size_budget:.0f} MB)"
+
+    # The runtime stage only holds the virtual environment, with the package's bytecode precompiled
+    package_name = project_path.name.replace("-", "_")
+    checks = f"test ! -e /app/src && ! command -v uv && find /app/.venv -path '*/{package_name}/__pycache__/*.pyc' | grep -q ."
+    result = run_command(
+        ["docker", "run", "--rm", "--entrypoint", "sh", image_name, "-c", checks],
+        cwd=project_path,
+        check=False,
+    )
+    assert result.returncode == 0, "The runtime image should have precompiled bytecode and neither src/ nor uv"
+
+    # A code change must not invalidate the dependency layer
+    package_init = project_path / "src" / package_name / "__init__.py"
+    original = package_init.read_bytes()
+    package_init.write_bytes(original + b"\n# rebuild check\n")
+    try:
+        result, rebuild_seconds = docker_build(project_path, image_name, target)
+    finally:
+        package_init.write_bytes(original)
+    assert result.returncode == 0, f"Docker rebuild failed: {result.stderr}"
+    output = result.stdout + result.stderr
+    step = re.search(r"^#(\d+) \[builder[^\]]*\] RUN .*--no-install-project", output, re.MULTILINE)
+    assert step and f"#{step.group(1)} CACHED" in output, "Dependency layer was rebuilt after a code change"
+    rebuild_budget = float(os.environ.get("DOCKER_REBUILD_MAX_SECONDS", DOCKER_REBUILD_MAX_SECONDS))
+    assert rebuild_seconds <= rebuild_budget, (
+        f"Docker rebuild took {rebuild_seconds:.0f}s (budget {rebuild_budget:.0f}s)"
+    )
+
+
 def install_pre_commit(project_path: Path) -> None:
     """Install pre-commit hooks."""
     result = run_command(
@@ -131,3 +270,122 @@ def install_pre_commit(project_path: Path) -> None:
         pass
     else:
         assert result.returncode == 0, f"Failed to install pre-commit hooks: {result.stderr}"
+
+
+class ProjectCache:
+    """Generate and install each project type at most once per test session.
+
+    Generating a project and running ``uv sync`` on it dominates the cost of the
+    end-to-end tests, so tests that only read a project share one copy of it.
+    Projects live under a per-session temporary directory, which pytest-xdist
+    makes unique per worker, so parallel workers never share a checkout.
+    """
+
+    def __init__(self, template_dir: Path, base_dir: Path) -> None:
+        self.template_dir = template_dir
+        self.base_dir = base_dir
+        self._generated: dict[str, Path] = {}
+        self._synced: set[str] = set()
+
+    def generated(self, project_type: str) -> Path:
+        """Return a generated project of the given type."""
+        if project_type not in self._generated:
+            self._generated[project_type] = generate_project(
+                self.template_dir, self.base_dir, project_type, f"test-{project_type}"
+            )
+        return self._generated[project_type]
+
+    def synced(self, project_type: str) -> Path:
+        """Return a generated project with its dev environment installed and git initialized."""
+        project_path = self.generated(project_type)
+        if project_type not in self._synced:
+            # uv sync installs the package in editable mode automatically
+            result = run_command(
+                ["uv", "sync", "--extra", "dev"],
+                cwd=project_path,
+            )
+            assert result.returncode == 0, f"{project_type}: Failed to install dependencies: {result.stderr}"
+            # Initialize git repository (required for pre-commit)
+            setup_git_repo(project_path)
+            self._synced.add(project_type)
+        return project_path
+
+
+@pytest.fixture(scope="session")
+def projects(template_dir, tmp_path_factory):
+    """Session-wide cache of generated and installed projects, one per project type."""
+    return ProjectCache(template_dir, tmp_path_factory.mktemp("projects"))
+
+
+def summarize_command_stats(stats: list[CommandStats]) -> dict[str, dict[str, dict[str, float]]]:
+    """Aggregate command stats per project type and step."""
+    summary: dict[str, dict[str, dict[str, float]]] = defaultdict(dict)
+    for stat in stats:
+        totals = summary[stat.project_type].setdefault(
+            stat.step, {"count": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "peak_rss_mb": 0.0}
+        )
+        totals["count"] += 1
+        totals["wall_seconds"] += stat.wall_seconds
+        totals["cpu_seconds"] += stat.cpu_seconds
+        totals["peak_rss_mb"] = max(totals["peak_rss_mb"], stat.peak_rss_mb)
+    return dict(summary)
+
+
+def pytest_addoption(parser):
+    """Add the command report option."""
+    parser.addoption(
+        "--command-report",
+        default="e2e-command-report.json",
+        help="where to write the JSON report of command timings (relative to the rootdir)",
+    )
+
+
+def pytest_configure(config):
+    """Collect command stats sent back by pytest-xdist workers."""
+    config.command_stats = []
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Receive the command stats of a pytest-xdist worker."""
+    stats = getattr(node, "workeroutput", {}).get("command_stats", [])
+    node.config.command_stats.extend(CommandStats(**stat) for stat in stats)
+
+
+def pytest_sessionfinish(session):
+    """Hand command stats to the controller, or write the JSON report."""
+    config = session.config
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["command_stats"] = [asdict(stat) for stat in COMMAND_STATS]
+        return
+
+    config.command_stats.extend(COMMAND_STATS)
+    if not config.command_stats:
+        return
+    report = {
+        "commands": [asdict(stat) for stat in config.command_stats],
+        "by_project_type": summarize_command_stats(config.command_stats),
+    }
+    report_path = Path(config.rootpath, config.getoption("command_report"))
+    report_path.write_text(json.dumps(report, indent=2))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Show the slowest commands and the per project type totals."""
+    stats = getattr(config, "command_stats", [])
+    if not stats:
+        return
+    terminalreporter.section("slowest commands")
+    for stat in sorted(stats, key=lambda s: s.wall_seconds, reverse=True)[:10]:
+        terminalreporter.write_line(
+            f"{stat.wall_seconds:8.2f}s wall {stat.cpu_seconds:8.2f}s cpu "
+            f"{stat.peak_rss_mb:8.1f} MB  [{stat.project_type}] {stat.command}"
+        )
+    terminalreporter.section("command totals per project type")
+    for project_type, steps in sorted(summarize_command_stats(stats).items()):
+        for step, totals in sorted(steps.items(), key=lambda item: item[1]["wall_seconds"], reverse=True):
+            terminalreporter.write_line(
+                f"{totals['wall_seconds']:8.2f}s wall {totals['cpu_seconds']:8.2f}s cpu "
+                f"{totals['peak_rss_mb']:8.1f} MB  [{project_type}] {step} (x{int(totals['count'])})"
+            )
+    terminalreporter.write_line(f"Command report written to {config.getoption('command_report')}")
@@ -0,0 +1,58 @@
+"""Tests that generated CI pipelines only contain the jobs of enabled features."""
+
+import pytest
+import yaml
+
+from tests.test_template_manifest import render
+
+ALWAYS = {"lint", "test", "security"}
+
+
+def ci_jobs(temp_dir, git_provider):
+    """Load the generated CI file and return its jobs and its raw bytes."""
+    project_path = temp_dir / "manifest-test"
+    ci_file = project_path / (".gitlab-ci.yml" if git_provider == "gitlab" else ".github/workflows/ci.yml")
+    raw = ci_file.read_bytes()
+    config = yaml.safe_load(raw)
+    jobs = config["jobs"] if git_provider == "github" else {
+        name: job for name, job in config.items() if isinstance(job, dict) and "script" in job
+    }
+    return config, jobs, raw
+
+
+class TestCIJobs:
+    """Tests for the CI job pruning done by the post-generation hook."""
+
+    @pytest.mark.parametrize(
+        ("context", "gitlab_jobs", "github_jobs"),
+        [
+            (
+                {"project_type": "library", "publish_to_pypi": "yes", "use_docker": "yes"},
+                {"build-package", "publish-pypi", "build-docker", "build-docs", "pages", "sonarqube"},
+                {"build-package", "publish-pypi", "build-docker", "build-docs"},
+            ),
+            (
+                {"project_type": "library", "publish_to_pypi": "no", "use_docker": "no"},
+                {"build-docs", "pages", "sonarqube"},
+                {"build-docs"},
+            ),
+            (
+                {"project_type": "datascience", "publish_to_pypi": "no", "use_docker": "yes"},
+                {"build-docker", "sonarqube"},
+                {"build-docker"},
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("git_provider", ["gitlab", "github"])
+    def test_jobs_follow_features(self, template_dir, temp_dir, context, gitlab_jobs, github_jobs, git_provider):
+        """Test that jobs of disabled features are dropped and the file stays valid."""
+        render(template_dir, temp_dir, use_ci="yes", git_provider=git_provider, github_org="test-org", **context)
+
+        config, jobs, raw = ci_jobs(temp_dir, git_provider)
+
+        assert set(jobs) == ALWAYS | (gitlab_jobs if git_provider == "gitlab" else github_jobs)
+        # Kept lines are written back untouched, line endings included
+        assert raw.count(b"\n") == raw.count(b"\r\n")
+        if git_provider == "gitlab":
+            # Every remaining stage still has a job
+            assert set(config["stages"]) == {job.get("stage", "test") for job in jobs.values()}
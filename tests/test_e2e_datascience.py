@@ -1,31 +1,31 @@
 """End-to-end tests for Data Science project type."""
 
+import csv
+import os
 import subprocess
 import time
 from pathlib import Path
 
 import pytest
 
-from tests.conftest import generate_project, install_pre_commit, run_command, setup_git_repo
+from tests.conftest import (
+    DOCKER_COLD_START_MAX_SECONDS,
+    check_docker_image,
+    docker_build,
+    install_pre_commit,
+    run_command,
+)
 
 
+@pytest.mark.xdist_group("datascience")
 class TestDataScienceProject:
     """End-to-end tests for Data Science project type."""
 
-    def test_datascience_generation_and_setup(self, template_dir, temp_dir):
+    def test_datascience_generation_and_setup(self, projects):
         """Test generating a Data Science project and running setup commands."""
         project_slug = "test-datascience"
-        project_path = generate_project(template_dir, temp_dir, "datascience", project_slug)
-
-        # Test 1: Install dependencies (uv sync installs the package in editable mode automatically)
-        result = run_command(
-            ["uv", "sync", "--extra", "dev"],
-            cwd=project_path,
-        )
-        assert result.returncode == 0, f"Failed to install dependencies: {result.stderr}"
-
-        # Initialize git repository (required for pre-commit)
-        setup_git_repo(project_path)
+        # Test 1: Install dependencies and initialize git (shared across the session)
+        project_path = projects.synced("datascience")
 
         # Test 2: Install pre-commit hooks (skip if git is not available)
         install_pre_commit(project_path)
@@ -68,35 +68,28 @@ class TestDataScienceProject:
         notebooks_dir = project_path / "notebooks"
         assert notebooks_dir.exists(), "notebooks directory should exist"
 
-    def test_datascience_docker_build_and_run(self, template_dir, temp_dir):
+    def test_datascience_docker_build_and_run(self, projects):
         """Test Docker build and run for Data Science project."""
         project_slug = "test-datascience"
-        project_path = generate_project(template_dir, temp_dir, "datascience", project_slug)
+        project_path = projects.generated("datascience")
 
         # Verify Dockerfile exists
         dockerfile = project_path / "Dockerfile"
         assert dockerfile.exists(), "Dockerfile should exist when use_docker=yes"
 
-        # Generate uv.lock file for Docker build
-        result = run_command(
-            ["uv", "lock"],
-            cwd=project_path,
-            check=False,
-        )
-        # Lock file generation is optional, but helpful for reproducible builds
+        # The image installs from uv.lock with --frozen
+        result = run_command(["uv", "lock"], cwd=project_path, check=False)
+        assert result.returncode == 0, f"uv lock failed: {result.stderr}"
 
         # Test Docker build
         image_name = f"{project_slug}:test"
-        result = run_command(
-            ["docker", "build", "-t", image_name, "."],
-            cwd=project_path,
-            check=False,
-        )
+        result, build_seconds = docker_build(project_path, image_name)
         if result.returncode != 0:
             # Docker might not be available, skip test
             pytest.skip(f"Docker build failed (docker may not be available): {result.stderr}")
 
         assert result.returncode == 0, f"Docker build failed: {result.stderr}"
+        check_docker_image(project_path, "datascience", image_name, build_seconds)
 
         # Test Docker run - start container in background
         container_name = f"{project_slug}-test-container"
@@ -169,3 +162,57 @@ class TestDataScienceProject:
                 cwd=project_path,
                 check=False,
             )
+
+    def test_datascience_batch_image(self, projects, tmp_path):
+        """Test the batch image: no Jupyter, within its size budget, and a fast cold start."""
+        project_slug = "test-datascience"
+        project_path = projects.generated("datascience")
+
+        result = run_command(["uv", "lock"], cwd=project_path, check=False)
+        assert result.returncode == 0, f"uv lock failed: {result.stderr}"
+
+        image_name = f"{project_slug}-batch:test"
+        result, build_seconds = docker_build(project_path, image_name, target="batch")
+        if result.returncode != 0:
+            pytest.skip(f"Docker build failed (docker may not be available): {result.stderr}")
+
+        try:
+            check_docker_image(project_path, "datascience", image_name, build_seconds, target="batch")
+
+            result = run_command(
+                ["docker", "run", "--rm", "--entrypoint", "python", image_name, "-c", "import jupyterlab"],
+                cwd=project_path,
+                check=False,
+            )
+            assert result.returncode != 0, "The batch image should not include Jupyter"
+
+            # Cold start: a fresh container running the pipeline on a small file
+            with open(tmp_path / "input.csv", "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["id", "label"])
+                writer.writerows((i, "even" if i % 2 == 0 else "odd") for i in range(1_000))
+            user = [f"--user={os.getuid()}:{os.getgid()}"] if hasattr(os, "getuid") else []
+            start = time.perf_counter()
+            result = run_command(
+                [
+                    "docker",
+                    "run",
+                    "--rm",
+                    *user,
+                    "-v",
+                    f"{tmp_path}:/data",
+                    image_name,
+                    "/data/input.csv",
+                    "/data/output.parquet",
+                ],
+                cwd=project_path,
+                check=False,
+            )
+            cold_start = time.perf_counter() - start
+            assert result.returncode == 0, f"Batch job failed: {result.stderr}"
+            assert '"rows": 1000' in result.stdout
+            assert (tmp_path / "output.parquet").exists()
+            budget = float(os.environ.get("DOCKER_COLD_START_MAX_SECONDS", DOCKER_COLD_START_MAX_SECONDS))
+            assert cold_start <= budget, f"Batch job took {cold_start:.1f}s (budget {budget:.0f}s)"
+        finally:
+            run_command(["docker", "rmi", image_name], cwd=project_path, check=False)
@@ -5,26 +5,18 @@ from pathlib import Path
 
 import pytest
 
-from tests.conftest import generate_project, install_pre_commit, run_command, setup_git_repo
+from tests.conftest import check_docker_image, docker_build, install_pre_commit, run_command
 
 
+@pytest.mark.xdist_group("library")
 class TestLibraryProject:
     """End-to-end tests for library project type."""
 
-    def test_library_generation_and_setup(self, template_dir, temp_dir):
+    def test_library_generation_and_setup(self, projects):
         """Test generating a library project and running setup commands."""
         project_slug = "test-library"
-        project_path = generate_project(template_dir, temp_dir, "library", project_slug)
-
-        # Test 1: Install dependencies (uv sync installs the package in editable mode automatically)
-        result = run_command(
-            ["uv", "sync", "--extra", "dev"],
-            cwd=project_path,
-        )
-        assert result.returncode == 0, f"Failed to install dependencies: {result.stderr}"
-
-        # Initialize git repository (required for pre-commit)
-        setup_git_repo(project_path)
+        # Test 1: Install dependencies and initialize git (shared across the session)
+        project_path = projects.synced("library")
 
         # Test 2: Install pre-commit hooks (skip if git is not available)
         install_pre_commit(project_path)
@@ -103,35 +95,28 @@ class TestLibraryProject:
         assert result.returncode == 0, f"Build failed: {result.stderr}"
         assert (project_path / "dist").exists(), "dist directory was not created"
 
-    def test_library_docker_build_and_run(self, template_dir, temp_dir):
+    def test_library_docker_build_and_run(self, projects):
         """Test Docker build and run for library project."""
         project_slug = "test-library"
-        project_path = generate_project(template_dir, temp_dir, "library", project_slug)
+        project_path = projects.generated("library")
 
         # Verify Dockerfile exists
         dockerfile = project_path / "Dockerfile"
         assert dockerfile.exists(), "Dockerfile should exist when use_docker=yes"
 
-        # Generate uv.lock file for Docker build
-        result = run_command(
-            ["uv", "lock"],
-            cwd=project_path,
-            check=False,
-        )
-        # Lock file generation is optional, but helpful for reproducible builds
+        # The image installs from uv.lock with --frozen
+        result = run_command(["uv", "lock"], cwd=project_path, check=False)
+        assert result.returncode == 0, f"uv lock failed: {result.stderr}"
 
         # Test Docker build
         image_name = f"{project_slug}:test"
-        result = run_command(
-            ["docker", "build", "-t", image_name, "."],
-            cwd=project_path,
-            check=False,
-        )
+        result, build_seconds = docker_build(project_path, image_name)
         if result.returncode != 0:
             # Docker might not be available, skip test
             pytest.skip(f"Docker build failed (docker may not be available): {result.stderr}")
 
         assert result.returncode == 0, f"Docker build failed: {result.stderr}"
+        check_docker_image(project_path, "library", image_name, build_seconds)
 
         # Test Docker run (non-blocking, short-lived)
         # For library projects, we just verify the container starts and exits
@@ -0,0 +1,103 @@
+"""Tests for the batch mode of generate.py."""
+
+import filecmp
+import json
+
+import pytest
+
+from generate import load_manifest, render_batch
+
+PROJECT_TYPES = ["library", "fastapi", "streamlit", "datascience"]
+
+
+def assert_same_tree(expected, actual):
+    """Assert two directory trees have the same files with the same contents."""
+    comparison = filecmp.dircmp(expected, actual)
+    assert not comparison.left_only, f"Missing from {actual}: {comparison.left_only}"
+    assert not comparison.right_only, f"Unexpected in {actual}: {comparison.right_only}"
+    _, mismatch, errors = filecmp.cmpfiles(expected, actual, comparison.common_files, shallow=False)
+    assert not mismatch and not errors, f"Different contents in {actual}: {mismatch + errors}"
+    for subdir in comparison.common_dirs:
+        assert_same_tree(expected / subdir, actual / subdir)
+
+
+class TestBatchGeneration:
+    """Tests that batch rendering matches cookiecutter output."""
+
+    def test_batch_matches_cookiecutter(self, template_dir, temp_dir):
+        """Test that every project type renders exactly as cookiecutter() renders it."""
+        from cookiecutter.main import cookiecutter
+
+        projects = [
+            {"project_name": f"Batch {project_type}", "project_type": project_type}
+            for project_type in PROJECT_TYPES
+        ]
+        projects.append(
+            {
+                "project_name": "Batch GitHub",
+                "project_type": "fastapi",
+                "git_provider": "github",
+                "github_org": "test-org",
+                "publish_to_pypi": "yes",
+            }
+        )
+
+        results = render_batch(projects, temp_dir / "batch")
+        for context in projects:
+            cookiecutter(
+                str(template_dir),
+                no_input=True,
+                extra_context=context,
+                output_dir=str(temp_dir / "reference"),
+            )
+
+        assert [r.project_type for r in results] == [p["project_type"] for p in projects]
+        for result in results:
+            assert result.seconds > 0
+            assert_same_tree(temp_dir / "reference" / result.project_slug, temp_dir / "batch" / result.project_slug)
+
+    def test_batch_with_process_pool(self, temp_dir):
+        """Test that rendering across worker processes produces every project."""
+        projects = [{"project_slug": f"pool-{t}", "project_type": t} for t in PROJECT_TYPES]
+
+        results = render_batch(projects, temp_dir, jobs=2)
+
+        assert [r.project_slug for r in results] == [p["project_slug"] for p in projects]
+        for result in results:
+            package_dir = temp_dir / result.project_slug / "src" / result.project_slug.replace("-", "_")
+            assert package_dir.exists(), f"{result.project_slug}: package directory missing"
+
+    def test_boolean_values(self, temp_dir):
+        """Test that TOML booleans switch yes/no options like the answers they stand for."""
+        projects = [
+            {"project_slug": "with-docker", "use_docker": True},
+            {"project_slug": "without-docker", "use_docker": False},
+        ]
+
+        render_batch(projects, temp_dir)
+
+        assert (temp_dir / "with-docker" / "Dockerfile").exists()
+        assert not (temp_dir / "without-docker" / "Dockerfile").exists()
+
+    @pytest.mark.parametrize(
+        ("filename", "content"),
+        [
+            ("manifest.json", json.dumps([{"project_name": "A"}, {"project_name": "B"}])),
+            ("manifest.json", json.dumps({"projects": [{"project_name": "A"}, {"project_name": "B"}]})),
+            ("manifest.toml", '[[projects]]\nproject_name = "A"\n\n[[projects]]\nproject_name = "B"\n'),
+        ],
+    )
+    def test_load_manifest(self, temp_dir, filename, content):
+        """Test that JSON and TOML manifests load as lists of contexts."""
+        manifest = temp_dir / filename
+        manifest.write_text(content)
+
+        assert load_manifest(manifest) == [{"project_name": "A"}, {"project_name": "B"}]
+
+    def test_load_manifest_rejects_non_list(self, temp_dir):
+        """Test that a manifest without a list of contexts is rejected."""
+        manifest = temp_dir / "manifest.json"
+        manifest.write_text(json.dumps({"projects": "library"}))
+
+        with pytest.raises(ValueError, match="list of project contexts"):
+            load_manifest(manifest)
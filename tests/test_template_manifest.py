@@ -0,0 +1,141 @@
+"""Tests that each configuration only generates the files it needs."""
+
+import pytest
+
+from tests.conftest import PROJECT_TYPES
+
+OPTIONAL_FILES = {
+    "tests/test_api.py",
+    "tests/test_streamlit.py",
+    "src/manifest_test/loaders.py",
+    "src/manifest_test/display.py",
+    "tests/test_display.py",
+    "src/manifest_test/data.py",
+    "tests/test_data.py",
+    "src/manifest_test/steps.py",
+    "tests/test_steps.py",
+    "src/manifest_test/experiments.py",
+    "tests/test_experiments.py",
+    "src/manifest_test/datasets.py",
+    "tests/test_datasets.py",
+    "tests/conftest.py",
+    "tests/test_batch.py",
+    "tests/test_main.py",
+    "tests/test_settings.py",
+    "src/manifest_test/settings.py",
+    "src/manifest_test/metrics.py",
+    "src/manifest_test/cache.py",
+    "tests/test_cache.py",
+    "src/manifest_test/responses.py",
+    "tests/test_responses.py",
+    "src/manifest_test/lazy.py",
+    "src/manifest_test/tools.py",
+    "tests/test_tools.py",
+    "src/manifest_test/batching.py",
+    "tests/test_batching.py",
+    "src/manifest_test/streaming.py",
+    "tests/test_streaming.py",
+    "benchmarks/load_test.py",
+    "tests/test_load_test.py",
+    "docs/api.md",
+    "docs/index.md",
+    "mkdocs.yml",
+    "notebooks/README.md",
+    "Dockerfile",
+    ".dockerignore",
+    ".gitlab-ci.yml",
+    "sonar-project.properties",
+    ".github/workflows/ci.yml",
+}
+
+EXPECTED_BY_TYPE = {
+    "library": {"tests/test_main.py", "docs/api.md", "docs/index.md", "mkdocs.yml"},
+    "fastapi": {
+        "tests/test_api.py",
+        "tests/test_settings.py",
+        "src/manifest_test/settings.py",
+        "src/manifest_test/metrics.py",
+        "src/manifest_test/cache.py",
+        "tests/test_cache.py",
+        "src/manifest_test/responses.py",
+        "tests/test_responses.py",
+        "src/manifest_test/lazy.py",
+        "src/manifest_test/tools.py",
+        "tests/test_tools.py",
+        "src/manifest_test/batching.py",
+        "tests/test_batching.py",
+        "src/manifest_test/streaming.py",
+        "tests/test_streaming.py",
+        "benchmarks/load_test.py",
+        "tests/test_load_test.py",
+        "docs/api.md",
+        "docs/index.md",
+        "mkdocs.yml",
+    },
+    "streamlit": {
+        "tests/test_streamlit.py",
+        "src/manifest_test/loaders.py",
+        "src/manifest_test/display.py",
+        "tests/test_display.py",
+        "docs/api.md",
+        "docs/index.md",
+        "mkdocs.yml",
+    },
+    "datascience": {
+        "tests/test_main.py",
+        "src/manifest_test/data.py",
+        "tests/test_data.py",
+        "src/manifest_test/steps.py",
+        "tests/test_steps.py",
+        "src/manifest_test/experiments.py",
+        "tests/test_experiments.py",
+        "src/manifest_test/datasets.py",
+        "tests/test_datasets.py",
+        "tests/conftest.py",
+        "tests/test_batch.py",
+        "notebooks/README.md",
+    },
+}
+
+
+def render(template_dir, output_dir, **context):
+    """Render a project and return the set of generated files."""
+    from cookiecutter.main import cookiecutter
+
+    cookiecutter(
+        str(template_dir),
+        no_input=True,
+        extra_context={"project_slug": "manifest-test", **context},
+        output_dir=str(output_dir),
+    )
+    project_path = output_dir / "manifest-test"
+    return {p.relative_to(project_path).as_posix() for p in project_path.rglob("*") if p.is_file()}
+
+
+class TestTemplateManifest:
+    """Tests for the optional files declared in local_extensions.py."""
+
+    @pytest.mark.parametrize("project_type", PROJECT_TYPES)
+    def test_only_project_type_files_are_generated(self, template_dir, temp_dir, project_type):
+        """Test that optional files belong to the chosen project type only."""
+        files = render(template_dir, temp_dir, project_type=project_type, use_docker="no", use_ci="no")
+
+        assert files & OPTIONAL_FILES == EXPECTED_BY_TYPE[project_type]
+        # Directories whose files were all skipped are not left behind
+        assert not (temp_dir / "manifest-test" / ".github").exists()
+        if project_type == "datascience":
+            assert not (temp_dir / "manifest-test" / "docs").exists()
+
+    @pytest.mark.parametrize(
+        ("context", "expected"),
+        [
+            ({"use_docker": "yes", "use_ci": "no"}, {"Dockerfile", ".dockerignore"}),
+            ({"use_docker": "no", "use_ci": "yes", "git_provider": "gitlab"}, {".gitlab-ci.yml", "sonar-project.properties"}),
+            ({"use_docker": "no", "use_ci": "yes", "git_provider": "github"}, {".github/workflows/ci.yml"}),
+        ],
+    )
+    def test_docker_and_ci_files(self, template_dir, temp_dir, context, expected):
+        """Test that Docker and CI files follow use_docker, use_ci and git_provider."""
+        files = render(template_dir, temp_dir, project_type="library", **context)
+
+        assert files & OPTIONAL_FILES == EXPECTED_BY_TYPE["library"] | expected
@@ -0,0 +1,139 @@
+"""Startup benchmark: import time of the entry point as a JSON report.
+
+Runs ``python -X importtime -c "import MODULE"`` in fresh interpreters and
+parses the timings into a report: the cumulative import time of the entry
+point, the wall and CPU time of the whole process (interpreter startup
+included) and the slowest imported modules. A warm-up run writes bytecode
+first, so the numbers match a deployed image where bytecode is precompiled.
+
+The budget applies to the CPU time of the process: wall times grow with other
+load on the machine (parallel tests, CI neighbours), CPU time hardly does.
+Process times are the best of ``--repeat`` runs, per-module times medians.
+``--budget-ms`` (default ``STARTUP_BUDGET_MS`` or the project's budget) makes
+the exit status fail when the CPU time is higher;
+``tests/test_startup.py`` runs this script to enforce the budget.
+
+Usage:
+    uv run python benchmarks/startup.py --repeat 10 --output startup.json
+    uv run python benchmarks/startup.py --module json --budget-ms 50
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any
+
+{% if cookiecutter.project_type == "fastapi" -%}
+# What ``python -m {{ cookiecutter.project_slug|replace('-', '_') }}`` imports in each worker before serving
+MODULE = "{{ cookiecutter.project_slug|replace('-', '_') }}.main"
+DEFAULT_BUDGET_MS = 2500.0
+{%- elif cookiecutter.project_type == "streamlit" -%}
+# What ``python -m {{ cookiecutter.project_slug|replace('-', '_') }}`` imports before streamlit starts the app
+MODULE = "{{ cookiecutter.project_slug|replace('-', '_') }}.__main__"
+DEFAULT_BUDGET_MS = 5000.0
+{%- elif cookiecutter.project_type == "datascience" -%}
+# What ``python -m {{ cookiecutter.project_slug|replace('-', '_') }}`` imports before the entry point runs
+MODULE = "{{ cookiecutter.project_slug|replace('-', '_') }}.__main__"
+DEFAULT_BUDGET_MS = 1500.0
+{%- else -%}
+# What ``python -m {{ cookiecutter.project_slug|replace('-', '_') }}`` imports before the entry point runs
+MODULE = "{{ cookiecutter.project_slug|replace('-', '_') }}.__main__"
+DEFAULT_BUDGET_MS = 500.0
+{%- endif %}
+
+{% raw %}
+def parse_importtime(stderr: str) -> dict[str, tuple[float, float]]:
+    """Self and cumulative import time in milliseconds of each module, from ``-X importtime``."""
+    times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "[us]" not in line:
+            self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+            times[name.strip()] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+    return times
+
+
+def import_once(module: str) -> tuple[dict[str, tuple[float, float]], float, float]:
+    """Import ``module`` in a fresh interpreter.
+
+    Returns the import times, and the wall and CPU time of the process in milliseconds.
+    """
+    code = f"import {module}; import time; print(time.process_time())"
+    command = [sys.executable, "-X", "importtime", "-c", code]
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    return parse_importtime(result.stderr), wall_ms, float(result.stdout.split()[-1]) * 1000
+
+
+def measure(module: str, repeat: int = 5, top: int = 15) -> dict[str, Any]:
+    """Timings of ``repeat`` imports of ``module``, after one warm-up import."""
+    import_once(module)
+    runs = [import_once(module) for _ in range(repeat)]
+    imports = [times[module][1] for times, _, _ in runs]
+
+    modules = {
+        name: (
+            statistics.median(times[name][0] for times, _, _ in runs if name in times),
+            statistics.median(times[name][1] for times, _, _ in runs if name in times),
+        )
+        for name in runs[0][0]
+    }
+    slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return {
+        "module": module,
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "cpu_ms": min(cpu for _, _, cpu in runs),
+        "process_ms": min(wall for _, wall, _ in runs),
+        "import_ms": min(imports),
+        "import_ms_median": statistics.median(imports),
+        "modules_imported": len(modules),
+        "slowest_self_ms": [
+            {"module": name, "self_ms": own, "cumulative_ms": cumulative}
+            for name, (own, cumulative) in slowest
+        ],
+        "modules": sorted(modules),
+    }
+
+
+def main() -> None:
+    """Measure startup and print or write the JSON report."""
+    parser = argparse.ArgumentParser(description="Measure the import time of the entry point")
+    parser.add_argument("--module", default=MODULE, help="module to import")
+    parser.add_argument("--repeat", type=int, default=5, help="measured imports")
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to report")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.environ.get("STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS)),
+        help="fail if the CPU time of the process is higher",
+    )
+    args = parser.parse_args()
+
+    report = measure(args.module, args.repeat, args.top)
+    report["budget_ms"] = args.budget_ms
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+    if report["cpu_ms"] > args.budget_ms:
+        slowest = "\n".join(
+            f"{entry['self_ms']:8.1f} ms  {entry['module']}" for entry in report["slowest_self_ms"]
+        )
+        print(
+            f"FAILED: importing {args.module} took {report['cpu_ms']:.0f} ms of CPU time "
+            f"(budget {args.budget_ms:.0f} ms). Slowest modules:\n{slowest}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(){% endraw %}
@@ -2,18 +2,74 @@
 
 {% if cookiecutter.project_type == "fastapi" %}
 import uvicorn
-from {{ cookiecutter.project_slug|replace('-', '_') }}.main import app
+
+from {{ cookiecutter.project_slug|replace('-', '_') }}.settings import get_settings
+
+
+def main() -> None:
+    """Serve the API with the workers and server options from the settings."""
+    settings = get_settings()
+    # Workers are separate processes, so uvicorn needs the app as an import string
+    uvicorn.run("{{ cookiecutter.project_slug|replace('-', '_') }}.main:app", **settings.uvicorn_options())
+
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    main()
 {% elif cookiecutter.project_type == "streamlit" %}
-import streamlit.web.cli as stcli
 import sys
+from pathlib import Path
+
+import streamlit.web.cli as stcli
 
 if __name__ == "__main__":
-    sys.argv = ["streamlit", "run", "{{ cookiecutter.project_slug|replace('-', '_') }}/main.py"]
+    # main.py is found next to this file, so this also runs from an installed package;
+    # extra arguments are passed on to streamlit, e.g. --server.port=8501
+    sys.argv = ["streamlit", "run", str(Path(__file__).with_name("main.py")), *sys.argv[1:]]
     sys.exit(stcli.main())
-{% else %}
+{% elif cookiecutter.project_type == "datascience" -%}
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+def run(source: Path, target: Path, chunk_rows: int | None = None) -> dict[str, Any]:
+    """Process ``source`` into ``target``: a ``.parquet`` or ``.arrow`` file, or a dataset."""
+    # Imported here, so that --help and argument errors do not wait for pandas and pyarrow
+    from {{ cookiecutter.project_slug|replace('-', '_') }}.data import CHUNK_ROWS, convert
+    from {{ cookiecutter.project_slug|replace('-', '_') }}.datasets import pack
+
+    start = time.perf_counter()
+    if target.suffix in (".parquet", ".arrow"):
+        # The job's transforms, e.g. data.drop_missing, go after the target
+        rows = convert(source, target, chunk_rows=chunk_rows or CHUNK_ROWS)
+    else:
+        rows = len(pack(source, target, chunk_rows=chunk_rows or CHUNK_ROWS))
+    seconds = round(time.perf_counter() - start, 3)
+    return {"source": str(source), "target": str(target), "rows": rows, "seconds": seconds}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the batch pipeline and print a JSON summary of the run."""
+    parser = argparse.ArgumentParser(
+        prog="python -m {{ cookiecutter.project_slug|replace('-', '_') }}",
+        description="Run the batch data pipeline.",
+    )
+    parser.add_argument("source", type=Path, help="CSV or Parquet input file")
+    parser.add_argument("target", type=Path, help=".parquet or .arrow file, or dataset directory")
+    parser.add_argument("--chunk-rows", type=int, help="rows read at a time (default: 100,000)")
+    args = parser.parse_args(argv)
+    if not args.source.is_file():
+        parser.error(f"{args.source} is not a file")
+    print(json.dumps(run(args.source, args.target, args.chunk_rows)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+{%- else %}
 def main() -> None:
     """Main entry point."""
     print("{{ cookiecutter.project_name }}")
@@ -1,9 +1,13 @@
 """Core functionality for {{ cookiecutter.project_slug }}."""
+{% if cookiecutter.project_type == "library" %}
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Annotated, Any, cast
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
 
 
-{% if cookiecutter.project_type == "library" %}
 class ExampleModel(BaseModel):
     """Example Pydantic model for the library."""
 
@@ -13,8 +17,124 @@ class ExampleModel(BaseModel):
     def process(self) -> str:
         """Process the model."""
         return f"{self.name}: {self.value}"
-{% else %}
+
+
+# Built once at import: creating an adapter compiles a validator, using it is cheap
+EXAMPLE_MODELS = TypeAdapter(list[ExampleModel])
+
+
+def column_adapter(field: FieldInfo) -> TypeAdapter[list[Any]]:
+    """Validator of a list of values, with the type and constraints of ``field``."""
+    # The item type is only known at runtime; built through Any, type checkers do not
+    # read it as a type expression
+    list_type = cast("Any", list)[cast("Any", Annotated)[field.annotation, field]]
+    return TypeAdapter(list_type)
+
+
+# One list validator per field
+COLUMN_ADAPTERS = {name: column_adapter(field) for name, field in ExampleModel.model_fields.items()}
+
+
+def validate_many(records: Iterable[Mapping[str, Any]]) -> list[ExampleModel]:
+    """Validate many records into models in a single call.
+
+    pydantic-core validates the whole list in one pass instead of one
+    ``ExampleModel(**record)`` call per record; errors give the index of each failing record.
+    """
+    return EXAMPLE_MODELS.validate_python(records)
+
+
+def validate_many_json(data: str | bytes) -> list[ExampleModel]:
+    """Parse and validate a JSON array of records, without intermediate dicts."""
+    return EXAMPLE_MODELS.validate_json(data)
+
+
+def process_many(models: Iterable[ExampleModel]) -> list[str]:
+    """``process()`` of each model."""
+    return [model.process() for model in models]
+
+
+def as_list(column: Iterable[Any]) -> list[Any]:
+    """Column as a list of Python objects; NumPy arrays are converted in C by ``tolist()``."""
+    tolist = getattr(column, "tolist", None)
+    return tolist() if tolist is not None else list(column)
+
+
+def validate_columns(columns: Mapping[str, Iterable[Any]]) -> dict[str, list[Any]]:
+    """Validate columns of field values (lists, tuples, NumPy arrays) without building models.
+
+    Each column is validated as a whole against its field. Raises ``ValueError`` when
+    a column is missing or the columns differ in length.
+    """
+    missing = COLUMN_ADAPTERS.keys() - columns.keys()
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(sorted(missing))}")
+    validated = {
+        name: adapter.validate_python(as_list(columns[name]))
+        for name, adapter in COLUMN_ADAPTERS.items()
+    }
+    if len({len(column) for column in validated.values()}) > 1:
+        raise ValueError("Columns must have the same length")
+    return validated
+
+
+def process_columns(columns: Mapping[str, Iterable[Any]]) -> list[str]:
+    """``process()`` of each row of ``columns``, without creating a model per row.
+
+    Returns a list, not an array: the library depends on pydantic only, and a NumPy
+    array of strings would not make the formatting any faster.
+    """
+    validated = validate_columns(columns)
+    return [
+        f"{name}: {value}"
+        for name, value in zip(validated["name"], validated["value"], strict=True)
+    ]
+
+
+@dataclass(slots=True, frozen=True)
+class ExampleRecord:
+    """Compact variant of :class:`ExampleModel` for holding many instances in memory.
+
+    A slots dataclass takes about a tenth of the memory of a model instance, but its
+    constructor does not validate: create records with :func:`validate_records`,
+    :func:`records_from_columns` or :func:`to_record`, and validate once at the boundary.
+    """
+
+    name: str
+    value: int
+
+    def process(self) -> str:
+        """Process the record, like :meth:`ExampleModel.process`."""
+        return f"{self.name}: {self.value}"
+
+
+EXAMPLE_RECORDS = TypeAdapter(list[ExampleRecord])
+
+
+def validate_records(records: Iterable[Mapping[str, Any]]) -> list[ExampleRecord]:
+    """Validate many records against the fields of :class:`ExampleRecord` in a single call."""
+    return EXAMPLE_RECORDS.validate_python(records)
+
+
+def records_from_columns(columns: Mapping[str, Iterable[Any]]) -> list[ExampleRecord]:
+    """Records from validated columns; see :func:`validate_columns`."""
+    validated = validate_columns(columns)
+    return list(map(ExampleRecord, validated["name"], validated["value"]))
+
+
+def to_record(model: ExampleModel) -> ExampleRecord:
+    """Record with the fields of an (already validated) model."""
+    return ExampleRecord(model.name, model.value)
+
+
+def to_model(record: ExampleRecord) -> ExampleModel:
+    """Model with the fields of a record, validated."""
+    return ExampleModel.model_validate(record, from_attributes=True)
+{%- else %}
+from pydantic import BaseModel
+
+
 def example_function() -> str:
     """Example function."""
     return "Hello from {{ cookiecutter.project_slug|replace('-', '_') }}"
-{% endif %}
+{%- endif %}
@@ -1,49 +1,63 @@
 {% if cookiecutter.project_type == "fastapi" %}
 """FastAPI application with MCP endpoint."""
 
-from fastapi import FastAPI
-from pydantic import BaseModel
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+from {{ cookiecutter.project_slug|replace('-', '_') }}.batching import Coalescer
+from {{ cookiecutter.project_slug|replace('-', '_') }}.cache import Cache, LRUCache
+from {{ cookiecutter.project_slug|replace('-', '_') }}.lazy import LazyApp
+from {{ cookiecutter.project_slug|replace('-', '_') }}.metrics import CONTENT_TYPE, Metrics, MetricsMiddleware
+from {{ cookiecutter.project_slug|replace('-', '_') }}.responses import json_response_options
+from {{ cookiecutter.project_slug|replace('-', '_') }}.settings import get_settings
+from {{ cookiecutter.project_slug|replace('-', '_') }}.streaming import ServerSentEvent, ndjson_response, sse_response
+
+settings = get_settings()
+mcp_app: LazyApp | None = None
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
+    """Stop the MCP server on shutdown if it was started."""
+    yield
+    if mcp_app is not None:
+        await mcp_app.aclose()
 
-try:
-    from fastmcp import FastMCP
-    MCP_AVAILABLE = True
-except ImportError:
-    MCP_AVAILABLE = False
 
 app = FastAPI(
     title="{{ cookiecutter.project_name }}",
     description="{{ cookiecutter.project_description }}",
     version="0.1.0",
+    lifespan=lifespan,
+    **json_response_options(settings.json_response),
 )
 
-if MCP_AVAILABLE:
-    try:
-        mcp = FastMCP("{{ cookiecutter.project_slug }}")
-
-        @mcp.tool()
-        def example_tool(query: str) -> str:
-            """Example MCP tool."""
-            return f"Processed: {query}"
-
-        # Try to include router - FastMCP API may vary by version
-        # Use getattr to safely access router without raising AttributeError
-        router = getattr(mcp, "router", None)
-        if router is None:
-            # Try alternative methods
-            get_router = getattr(mcp, "get_router", None)
-            if get_router:
-                router = get_router()
-            else:
-                as_router = getattr(mcp, "as_router", None)
-                if as_router:
-                    router = as_router()
-        
-        if router is not None:
-            app.include_router(router)
-    except Exception:
-        # If MCP setup fails or router is not available, continue without it
-        # The MCP tools may still be registered via other mechanisms
-        pass
+metrics = Metrics()
+app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+cache = Cache(
+    LRUCache(max_entries=settings.cache_max_entries, max_bytes=settings.cache_max_bytes),
+    ttl=settings.cache_ttl,
+    name="app",
+)
+
+
+async def process_query(query: str) -> str:
+    """Process one query; the work behind example_tool, batch_tool and /batch."""
+    return f"Processed: {query}"
+
+
+# Shared by the HTTP routes and the MCP tools, so identical queries coalesce across both
+query_runner = Coalescer(process_query, max_concurrency=settings.batch_max_concurrency)
+
+if settings.mcp_enabled:
+    # Mounted lazily: tools.py and FastMCP are imported on the first MCP request
+    mcp_app = LazyApp("{{ cookiecutter.project_slug|replace('-', '_') }}.tools:http_app")
+    app.mount(settings.mcp_path, mcp_app)
 
 
 class HealthResponse(BaseModel):
@@ -53,7 +67,20 @@ class HealthResponse(BaseModel):
     version: str
 
 
+class BatchRequest(BaseModel):
+    """Queries to process in one request."""
+
+    queries: list[str] = Field(max_length=settings.batch_max_size)
+
+
+class BatchResponse(BaseModel):
+    """Results of a batch, in the order of its queries."""
+
+    results: list[str]
+
+
 @app.get("/", tags=["root"])
+@cache.response()
 async def root() -> dict[str, str]:
     """Root endpoint."""
     return {"message": "{{ cookiecutter.project_name }} API"}
@@ -63,12 +90,59 @@ async def root() -> dict[str, str]:
 async def health() -> HealthResponse:
     """Health check endpoint."""
     return HealthResponse(status="healthy", version="0.1.0")
+
+
+@app.post("/batch", tags=["batch"])
+async def batch(request: BatchRequest) -> BatchResponse:
+    """Process many queries concurrently; duplicate queries are computed once."""
+    return BatchResponse(results=await query_runner.map(request.queries))
+
+
+@app.get("/stream/items", tags=["stream"])
+async def stream_items(
+    count: int = Query(default=100, ge=0, le=settings.stream_max_items),
+) -> StreamingResponse:
+    """Stream a large result set as NDJSON, one item per line, as items are computed."""
+
+    async def items() -> AsyncGenerator[dict[str, int | str]]:
+        for i in range(count):
+            yield {"id": i, "result": await process_query(str(i))}
+
+    return ndjson_response(items(), maxsize=settings.stream_queue_size)
+
+
+@app.get("/stream/tokens", tags=["stream"])
+async def stream_tokens(query: str) -> StreamingResponse:
+    """Stream the result of a query token by token as Server-Sent Events."""
+
+    async def tokens() -> AsyncGenerator[ServerSentEvent]:
+        result = await query_runner(query)
+        for token in result.split():
+            yield ServerSentEvent(token, event="token")
+        yield ServerSentEvent("", event="done")
+
+    return sse_response(tokens(), maxsize=settings.stream_queue_size)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics() -> PlainTextResponse:
+    """Request metrics in the Prometheus text format."""
+    return PlainTextResponse(metrics.render() + cache.render_metrics(), media_type=CONTENT_TYPE)
 {% elif cookiecutter.project_type == "streamlit" %}
-"""Streamlit application."""
+"""Streamlit application.
+
+Streamlit reruns this script on every interaction. Slow work lives in cached
+loaders (see loaders.py), state that must survive reruns lives in
+``st.session_state``, and widgets that only affect part of the page sit in a
+fragment, so changing them reruns the fragment instead of the whole script.
+"""
 
 import streamlit as st
 from pydantic import BaseModel, ValidationError
 
+from {{ cookiecutter.project_slug|replace('-', '_') }}.display import show_dataframe, show_line_chart
+from {{ cookiecutter.project_slug|replace('-', '_') }}.loaders import STATS, load_examples, load_timeseries, value_counts
+
 
 class ExampleModel(BaseModel):
     """Example Pydantic model."""
@@ -77,6 +151,56 @@ class ExampleModel(BaseModel):
     value: int
 
 
+# Session state keys and their initial values; each browser session has its own copy
+STATE_DEFAULTS = {
+    "runs": 0,
+    "fragment_runs": 0,
+    "models": [],
+    "error": None,
+}
+
+
+def init_state() -> None:
+    """Set missing session state keys and count this run."""
+    for key, value in STATE_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = value.copy() if isinstance(value, list) else value
+    st.session_state.runs += 1
+
+
+def submit_model() -> None:
+    """Form callback: validate the submitted values once and keep the model in session state.
+
+    Callbacks run before the rerun they trigger, so the page renders the new state directly.
+    """
+    try:
+        model = ExampleModel(name=st.session_state.name, value=st.session_state.value)
+    except ValidationError as e:
+        st.session_state.error = str(e)
+        return
+    st.session_state.error = None
+    st.session_state.models.append(model)
+
+
+@st.fragment
+def examples_view() -> None:
+    """Filtered examples; changing the filter reruns only this fragment."""
+    st.session_state.fragment_runs += 1
+    min_value = st.slider("Minimum value", min_value=0, max_value=100, value=0, key="min_value")
+    st.bar_chart(value_counts(min_value))
+    show_dataframe(load_examples(min_value), key="examples")
+
+
+def sidebar() -> None:
+    """Rerun and cache statistics of this session and process."""
+    with st.sidebar:
+        st.caption("Reruns")
+        st.write(f"Script: {st.session_state.runs}, fragment: {st.session_state.fragment_runs}")
+        st.caption("Cached loaders")
+        for name, stats in STATS.items():
+            st.write(f"`{name}`: {stats.hits} hits, {stats.misses} misses")
+
+
 def main() -> None:
     """Main Streamlit application."""
     st.set_page_config(
@@ -84,21 +208,25 @@ def main() -> None:
         page_icon="🚀",
         layout="wide",
     )
+    init_state()
 
     st.title("{{ cookiecutter.project_name }}")
     st.write("{{ cookiecutter.project_description }}")
 
     with st.form("example_form"):
-        name = st.text_input("Name", value="Example")
-        value = st.number_input("Value", min_value=0, value=42)
-        submitted = st.form_submit_button("Submit")
-
-        if submitted:
-            try:
-                model = ExampleModel(name=name, value=value)
-                st.success(f"Created model: {model.model_dump_json()}")
-            except ValidationError as e:
-                st.error(f"Validation error: {e}")
+        st.text_input("Name", value="Example", key="name")
+        st.number_input("Value", min_value=0, value=42, key="value")
+        st.form_submit_button("Submit", on_click=submit_model)
+
+    if st.session_state.error:
+        st.error(f"Validation error: {st.session_state.error}")
+    for model in st.session_state.models:
+        st.success(f"Created model: {model.model_dump_json()}")
+
+    examples_view()
+    # A million points, sent to the browser as at most POINT_BUDGET
+    show_line_chart(load_timeseries(), x="time", y=["value"])
+    sidebar()
 
 
 if __name__ == "__main__":
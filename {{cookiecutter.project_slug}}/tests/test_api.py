@@ -1,23 +0,0 @@
-"""Tests for API endpoints."""
-
-import pytest
-from fastapi.testclient import TestClient
-from {{ cookiecutter.project_slug|replace('-', '_') }}.main import app
-
-client = TestClient(app)
-
-
-def test_root() -> None:
-    """Test root endpoint."""
-    response = client.get("/")
-    assert response.status_code == 200
-    assert "message" in response.json()
-
-
-def test_health() -> None:
-    """Test health endpoint."""
-    response = client.get("/health")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["status"] == "healthy"
-    assert "version" in data
@@ -1,23 +1,151 @@
 """Tests for core functionality."""
+{% if cookiecutter.project_type == "library" %}
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any, cast
 
 import pytest
-{% if cookiecutter.project_type == "library" %}
-from {{ cookiecutter.project_slug|replace('-', '_') }}.core import ExampleModel
-{% else %}
-from {{ cookiecutter.project_slug|replace('-', '_') }}.core import example_function
-{% endif %}
+from pydantic import ValidationError
+
+from {{ cookiecutter.project_slug|replace('-', '_') }}.core import (
+    ExampleModel,
+    ExampleRecord,
+    process_columns,
+    process_many,
+    records_from_columns,
+    to_model,
+    to_record,
+    validate_columns,
+    validate_many,
+    validate_many_json,
+    validate_records,
+)
+
+RECORDS: list[dict[str, Any]] = [{"name": f"item-{i}", "value": i} for i in range(50_000)]
 
 
-{% if cookiecutter.project_type == "library" %}
 def test_example_model() -> None:
     """Test ExampleModel."""
     model = ExampleModel(name="test", value=42)
     assert model.name == "test"
     assert model.value == 42
     assert model.process() == "test: 42"
-{% else %}
+
+
+def test_validate_many() -> None:
+    """Test that batch validation matches per-record models and reports failing indexes."""
+    models = validate_many(RECORDS[:3])
+    assert models == [ExampleModel(**record) for record in RECORDS[:3]]
+    assert validate_many_json(json.dumps(RECORDS[:3])) == models
+    assert process_many(models) == ["item-0: 0", "item-1: 1", "item-2: 2"]
+
+    with pytest.raises(ValidationError) as error:
+        validate_many([{"name": "a", "value": 1}, {"name": "b", "value": "x"}])
+    assert error.value.errors()[0]["loc"] == (1, "value")
+
+
+def test_process_columns() -> None:
+    """Test that the columnar path matches process() and validates each column."""
+    columns = {"name": ["a", "b"], "value": ("1", 2)}
+    assert process_columns(columns) == ["a: 1", "b: 2"]
+    assert validate_columns(columns)["value"] == [1, 2]
+
+    with pytest.raises(ValidationError):
+        process_columns({"name": ["a"], "value": ["x"]})
+    with pytest.raises(ValueError, match="Missing columns: value"):
+        process_columns({"name": ["a"]})
+    with pytest.raises(ValueError, match="same length"):
+        process_columns({"name": ["a", "b"], "value": [1]})
+
+
+def best_time(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Fastest of ``repeat`` calls, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+# The default run checks on a tenth of the records; `pytest -m slow` runs the full benchmark
+SIZES = [5_000, pytest.param(50_000, marks=pytest.mark.slow)]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_batch_throughput_benchmark(size: int) -> None:
+    """Benchmark per-record models against batch validation and the columnar path."""
+    records = RECORDS[:size]
+    columns = {"name": [r["name"] for r in records], "value": [r["value"] for r in records]}
+    expected = [ExampleModel(**record).process() for record in records]
+    assert process_many(validate_many(records)) == expected
+    assert process_columns(columns) == expected
+
+    per_record = best_time(lambda: [ExampleModel(**record).process() for record in records])
+    batch = best_time(lambda: process_many(validate_many(records)))
+    columnar = best_time(lambda: process_columns(columns))
+    print(
+        f"\n{size:,} records/s: per record {size / per_record:,.0f}, "
+        f"batch {size / batch:,.0f}, columnar {size / columnar:,.0f}"
+    )
+    # Both vectorized paths beat per-record models, but batch validation only by a margin
+    # that timing noise can erase; the columnar path wins by several times
+    assert columnar * 2 < per_record
+    assert columnar < batch
+
+
+def test_records() -> None:
+    """Test that records validate at the boundary, process like models and convert both ways."""
+    records = validate_records([{"name": "a", "value": "1"}])
+    assert records == [ExampleRecord("a", 1)]
+    assert records_from_columns({"name": ["a"], "value": [1]}) == records
+    assert records[0].process() == ExampleModel(name="a", value=1).process()
+
+    model = to_model(records[0])
+    assert model == ExampleModel(name="a", value=1)
+    assert to_record(model) == records[0]
+
+    with pytest.raises(ValidationError):
+        validate_records([{"name": "a", "value": "x"}])
+    with pytest.raises(ValidationError):
+        # Records are not validated on construction, models are
+        to_model(ExampleRecord("a", cast("int", "x")))
+
+
+def bytes_per_instance(create: Callable[[], list[Any]]) -> float:
+    """Memory allocated by ``create()`` per created instance, in bytes."""
+    tracemalloc.start()
+    instances = create()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(instances)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_record_memory_benchmark(size: int) -> None:
+    """Benchmark the memory per instance of models and records."""
+    # Field values are created up front: both types share them
+    names = [record["name"] for record in RECORDS[:size]]
+    values = [record["value"] for record in RECORDS[:size]]
+
+    model = bytes_per_instance(
+        lambda: [ExampleModel(name=n, value=v) for n, v in zip(names, values, strict=True)]
+    )
+    record = bytes_per_instance(lambda: list(map(ExampleRecord, names, values)))
+    print(
+        f"\nbytes per instance: ExampleModel {model:.0f}, ExampleRecord {record:.0f} "
+        f"(getsizeof {sys.getsizeof(ExampleRecord('a', 1))})"
+    )
+    assert record * 4 < model
+{%- else %}
+from {{ cookiecutter.project_slug|replace('-', '_') }}.core import example_function
+
+
 def test_example_function() -> None:
     """Test example function."""
     result = example_function()
     assert result == "Hello from {{ cookiecutter.project_slug|replace('-', '_') }}"
-{% endif %}
+{%- endif %}
@@ -0,0 +1,46 @@
+"""Startup budget of the package, measured by benchmarks/startup.py."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+STARTUP = Path(__file__).parent.parent / "benchmarks" / "startup.py"
+
+
+@pytest.fixture(scope="module")
+def startup_report(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Any]:
+    """Startup report of the entry point; the script fails when it is over budget."""
+    output = tmp_path_factory.mktemp("startup") / "startup.json"
+    result = subprocess.run(
+        [sys.executable, str(STARTUP), "--repeat", "3", "--output", str(output)],
+        capture_output=True,
+        text=True,
+        timeout=300,
+        check=False,
+    )
+    return {
+        "returncode": result.returncode,
+        "stderr": result.stderr,
+        **json.loads(output.read_text()),
+    }
+
+
+def test_startup_budget(startup_report: dict[str, Any]) -> None:
+    """Test that importing the entry point stays within STARTUP_BUDGET_MS."""
+    assert startup_report["returncode"] == 0, startup_report["stderr"]
+    assert 0 < startup_report["cpu_ms"] <= startup_report["budget_ms"]
+    assert 0 < startup_report["import_ms"] <= startup_report["process_ms"]
+{%- if cookiecutter.project_type == "fastapi" %}
+
+
+def test_mcp_not_imported_at_startup(startup_report: dict[str, Any]) -> None:
+    """Test that FastMCP is only imported when the MCP endpoint is used."""
+    mcp_modules = [
+        name for name in startup_report["modules"] if name.split(".")[0] in ("fastmcp", "mcp")
+    ]
+    assert not mcp_modules
+{%- endif %}